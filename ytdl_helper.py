@@ -18,27 +18,376 @@ Module functions
 - :func:`progress_hook` -- progress callback used by ``yt_dlp``
 - :func:`build_ydl_opts` -- construct yt-dlp options dictionary
 - :func:`download_videos` -- download a list of URLs using constructed options
+- :func:`iter_urls` -- lazily read URLs from arguments, a file or stdin
 - :func:`parse_args` -- parse CLI arguments
 - :func:`main` -- entrypoint for command-line execution
 
 """
 
 import argparse
+import contextlib
+import functools
 import logging
 import os
+import queue
+import re
+import shutil
 import sys
-from typing import List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
 
-import yt_dlp
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+if TYPE_CHECKING:
+	import yt_dlp
+
+
+@functools.lru_cache(maxsize=None)
+def _yt_dlp():
+	"""Import and return the ``yt_dlp`` package on first use.
+
+	Importing yt-dlp loads its whole extractor registry, which takes a
+	noticeable fraction of a second; deferring it keeps ``--help`` and
+	argument errors instant. When :mod:`orjson` is installed, yt-dlp's
+	info.json writer is switched to :func:`_orjson_write_json_file`.
+	"""
+	import yt_dlp
+
+	# lru_cache does not stop worker threads running this body concurrently,
+	# so never save an already patched writer as the fallback.
+	ydl_module = sys.modules.get('yt_dlp.YoutubeDL')
+	writer = getattr(ydl_module, 'write_json_file', None)
+	if orjson is not None and writer not in (None, _orjson_write_json_file):
+		global _stdlib_write_json_file
+		_stdlib_write_json_file = writer
+		ydl_module.write_json_file = _orjson_write_json_file
+	return yt_dlp
+
+
+# yt-dlp's own ``write_json_file``, kept as fallback once it is replaced.
+_stdlib_write_json_file = None
+
+
+def _orjson_write_json_file(obj, fn: str):
+	"""Write ``obj`` as JSON to ``fn`` using orjson, replacing ``fn`` atomically.
+
+	yt-dlp serializes info.json with ``json.dump``, which always runs the
+	pure-Python encoder. Objects orjson cannot encode (e.g. integers wider
+	than 64 bits) fall back to yt-dlp's writer.
+	"""
+	try:
+		data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+	except TypeError:
+		return _stdlib_write_json_file(obj, fn)
+	tmp = f'{fn}.tmp'
+	try:
+		with open(tmp, 'wb') as f:
+			f.write(data)
+		os.replace(tmp, fn)
+	except BaseException:
+		try:
+			os.remove(tmp)
+		except OSError:
+			pass
+		raise
+
+
+@functools.lru_cache(maxsize=None)
+def _impersonate_available(target: str) -> bool:
+	"""Return whether yt-dlp has a handler that can impersonate ``target``.
+
+	yt-dlp only registers its curl_cffi handler for curl_cffi versions it
+	supports, so this is stricter than checking that ``curl_cffi`` is
+	installed. Raises :class:`ValueError` if ``target`` is malformed.
+	"""
+	try:
+		from yt_dlp.networking.common import _REQUEST_HANDLERS
+		from yt_dlp.networking.impersonate import (
+			ImpersonateRequestHandler,
+			ImpersonateTarget,
+		)
+	except ImportError:
+		return False
+	parsed = ImpersonateTarget.from_str(target)
+	return any(
+		issubclass(handler, ImpersonateRequestHandler)
+		and any(parsed in supported for supported in handler.supported_targets)
+		for handler in _REQUEST_HANDLERS.values()
+	)
+
+
+# Per-thread download context. Worker threads started by
+# :func:`download_videos` set ``url_id`` so progress lines from concurrent
+# downloads can be told apart.
+_progress_local = threading.local()
+
+# Minimum seconds between progress updates, and the percentage step used
+# when progress is logged as separate lines rather than redrawn in place.
+_PROGRESS_INTERVAL = 0.1
+_PROGRESS_LOG_STEP = 5
+
+# Progress lines and log records waiting for the writer thread started by
+# :func:`_progress_display`. Items are ``(key, text)`` tuples: ``key`` is a
+# URL id (``None`` for sequential downloads) whose status line is replaced
+# by ``text``, or removed when ``text`` is ``None``; ``_LOG`` items print
+# ``text`` above the status block and ``_STOP`` ends the thread.
+_progress_q: queue.SimpleQueue = queue.SimpleQueue()
+_LOG = object()
+_STOP = object()
+_progress_active = False
+
+# FFmpeg input arguments for each ``--hwaccel`` choice. Decoded frames stay
+# in GPU memory for CUDA only when an NVENC encoder consumes them directly.
+_HWACCEL_INPUT_ARGS = {
+	'cuda': ['-hwaccel', 'cuda'],
+	'vaapi': ['-hwaccel', 'vaapi'],
+	'qsv': ['-hwaccel', 'qsv'],
+}
+
+# Options shared by every ``build_ytdl_opts`` call. Only immutable values
+# live here; per-call fields are filled in on a copy.
+_BASE_OPTS = MappingProxyType(
+	{
+		'outtmpl': '%(uploader)s - %(title)s.%(ext)s',
+		'windowsfilenames': True,
+		'format': 'bv*+ba/b',
+		'merge_output_format': 'mp4',
+		'writesubtitles': True,
+		'embedsubtitles': True,
+		'subtitlesformat': 'srt/best',
+		'writethumbnail': True,
+		'embedthumbnail': True,
+		'retries': 10,
+		'fragment_retries': 10,
+		'continuedl': True,
+		'no_warnings': False,
+		'ignoreerrors': False,
+	}
+)
+
+# Optional first postprocessors: remux to mp4 (``--force-remux`` and before
+# re-encoding), re-encode when a codec is chosen, or extract the audio track
+# for audio-only downloads. The re-encode uses ``FFmpegCopyStream``, which
+# always runs (unlike ``FFmpegVideoConvertor``, which skips files already in
+# mp4); the encoder arguments given for it override its ``-c copy``.
+_VIDEO_REMUX_PP = MappingProxyType(
+	{'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mp4'}
+)
+_VIDEO_REENCODE_PP = MappingProxyType({'key': 'FFmpegCopyStream'})
+_EXTRACT_AUDIO_PP = MappingProxyType(
+	{'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3'}
+)
+
+# Thumbnail postprocessors, skipped with ``--no-thumbnail``.
+_THUMBNAIL_POSTPROCESSORS = (
+	MappingProxyType({'key': 'FFmpegThumbnailsConvertor', 'format': 'jpg'}),
+	MappingProxyType({'key': 'EmbedThumbnail', 'already_have_thumbnail': True}),
+)
+
+_METADATA_PP = MappingProxyType({'key': 'FFmpegMetadata'})
+
+# Among formats of the best resolution and frame rate, prefer streams that
+# merge into mp4 with a plain stream copy, so no remux or re-encode step is
+# needed afterwards. Resolution stays first so codec never costs quality.
+_MP4_FORMAT_SORT = ('res', 'fps', 'vcodec:h264', 'acodec:aac', 'ext:mp4')
+
+# yt-dlp options echoed by :func:`download_videos` at DEBUG log level.
+_DEBUG_OPT_KEYS = (
+	'format',
+	'format_sort',
+	'merge_output_format',
+	'writesubtitles',
+	'embedsubtitles',
+	'subtitleslangs',
+	'compat_opts',
+	'writethumbnail',
+	'embedthumbnail',
+	'retries',
+	'continuedl',
+	'concurrent_fragment_downloads',
+	'http_chunk_size',
+	'external_downloader',
+	'impersonate',
+	'postprocessor_args',
+)
+
+# Retries for a URL rejected with HTTP 429, with exponential backoff capped
+# at ``_RATE_LIMIT_MAX_DELAY`` seconds.
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_MAX_DELAY = 60
+
+# Consecutive HTTP 403 failures from one host after which its remaining
+# URLs are skipped.
+_FORBIDDEN_LIMIT = 3
+
+# Fragment concurrency that works well for specific hosts (matched by domain
+# suffix) when ``--concurrent-fragments`` is not given.
+_FRAG_CONCURRENCY = {
+	'youtube.com': 4,
+	'youtu.be': 4,
+	'archive.org': 16,
+	'ok.ru': 8,
+	'twitch.tv': 8,
+}
+
+_HTTP_STATUS_RE = re.compile(r'HTTP Error (\d{3})')
+
+_NVENC_CODECS = ('h264_nvenc', 'hevc_nvenc', 'av1_nvenc')
+_NVENC_PRESETS = ('p1', 'p2', 'p3', 'p4', 'p5', 'p6', 'p7', 'hq', 'll')
+
+
+class _QueueLogHandler(logging.Handler):
+	"""Send formatted log records to the progress writer thread."""
+
+	def emit(self, record: logging.LogRecord):
+		try:
+			_progress_q.put_nowait((_LOG, self.format(record)))
+		except Exception:
+			self.handleError(record)
+
+
+def _run_progress_writer(out, err):
+	"""Redraw one status line per active download until ``_STOP`` arrives.
+
+	All queued updates are drained before each redraw, so a burst of events
+	costs a single write. Log records are printed to ``err`` above the block
+	so they do not get overwritten by the next redraw.
+	"""
+	lines: Dict[Optional[str], str] = {}
+	drawn = 0
+	stop = False
+	while not stop:
+		batch = [_progress_q.get()]
+		with contextlib.suppress(queue.Empty):
+			while True:
+				batch.append(_progress_q.get_nowait())
+
+		logs = []
+		changed = False
+		for key, text in batch:
+			if key is _STOP:
+				stop = True
+			elif key is _LOG:
+				logs.append(text)
+			elif text is None:
+				changed |= lines.pop(key, None) is not None
+			elif lines.get(key) != text:
+				lines[key] = text
+				changed = True
+		if not (logs or changed or stop):
+			continue
+
+		# Move to the top of the previous block and clear it.
+		out.write(f'\x1b[{drawn}F\x1b[J' if drawn else '\r\x1b[J')
+		out.flush()
+		for text in logs:
+			err.write(f'{text}\n')
+		err.flush()
+		if stop:
+			break
+		width = max(shutil.get_terminal_size().columns - 1, 1)
+		out.write(''.join(f'{text[:width]}\n' for text in lines.values()))
+		out.flush()
+		drawn = len(lines)
+
+
+class _YtdlpLogger:
+	"""``logger`` for yt-dlp that forwards its messages to :mod:`logging`.
+
+	yt-dlp hands regular screen messages to the logger even when ``quiet`` is
+	set, so they are dropped here in that case, as yt-dlp would do itself.
+	"""
+
+	_log = logging.getLogger('yt_dlp')
+
+	def __init__(self, quiet: bool = False):
+		self.quiet = quiet
+
+	def debug(self, msg: str):
+		# yt-dlp sends both debug output and regular screen messages here.
+		if msg.startswith('[debug] '):
+			self._log.debug(msg)
+		elif not self.quiet:
+			self._log.info(msg)
+
+	def info(self, msg: str):
+		self._log.info(msg)
+
+	def warning(self, msg: str):
+		self._log.warning(msg)
+
+	def error(self, msg: str):
+		self._log.error(msg)
+
+
+@contextlib.contextmanager
+def _progress_display() -> Iterator[bool]:
+	"""Draw progress through a writer thread while the block is active.
+
+	Only used when stdout is a terminal; yields whether it is in effect.
+	Download threads then just enqueue their status line in
+	:func:`progress_hook`; stderr log handlers on the root logger are
+	swapped for :class:`_QueueLogHandler` so log records and the status
+	block do not overwrite each other.
+	"""
+	global _progress_active
+	if not sys.stdout.isatty():
+		yield False
+		return
+
+	root = logging.getLogger()
+	redirected = [
+		h
+		for h in root.handlers
+		if isinstance(h, logging.StreamHandler) and h.stream in (sys.stderr, sys.stdout)
+	]
+	handler = _QueueLogHandler()
+	if redirected:
+		handler.setLevel(redirected[0].level)
+		handler.setFormatter(redirected[0].formatter)
+	for h in redirected:
+		root.removeHandler(h)
+	root.addHandler(handler)
+
+	writer = threading.Thread(
+		target=_run_progress_writer,
+		args=(sys.stdout, sys.stderr),
+		name='progress-writer',
+		daemon=True,
+	)
+	writer.start()
+	_progress_active = True
+	try:
+		yield True
+	finally:
+		_progress_active = False
+		root.removeHandler(handler)
+		_progress_q.put((_STOP, None))
+		writer.join()
+		for h in redirected:
+			root.addHandler(h)
 
 
 def progress_hook(d: dict):
 	"""Progress hook for yt-dlp download events.
 
 	This function is intended to be supplied to ``yt_dlp.YoutubeDL`` via the
-	``progress_hooks`` option. It prints a simple progress line to stdout when
-	status is ``downloading`` and logs filenames when the download or
-	post-processing is finished.
+	``progress_hooks`` option. It reports progress when status is
+	``downloading`` and logs filenames when the download or post-processing
+	is finished. Progress updates are throttled to one every
+	``_PROGRESS_INTERVAL`` seconds. While :func:`_progress_display` is
+	active, the status line (prefixed with the worker's URL id for
+	concurrent downloads) is only queued for the writer thread, which keeps
+	one line per download on screen. Otherwise, e.g. when stdout is not a
+	terminal, progress is logged once per ``_PROGRESS_LOG_STEP`` percent.
 
 	Parameters
 	----------
@@ -55,15 +404,42 @@ def progress_hook(d: dict):
 	if d.get('status') == 'downloading':
 		total = d.get('total_bytes') or d.get('total_bytes_estimate')
 		downloaded = d.get('downloaded_bytes', 0)
-		if total:
-			pct = downloaded / total * 100
-			speed = d.get('speed', 0)
-			eta = d.get('eta', 0)
-			sys.stdout.write(
-				f'\rProgress {pct:5.1f}%  Speed {speed:.0f}B/s  ETA {eta}s'
+		if not total:
+			return
+		now = time.monotonic()
+		last_ts = getattr(_progress_local, 'last_ts', 0.0)
+		if downloaded < total and now - last_ts < _PROGRESS_INTERVAL:
+			return
+		_progress_local.last_ts = now
+
+		pct = downloaded / total * 100
+		rounded = int(pct)
+		speed = d.get('speed') or 0
+		eta = d.get('eta') or 0
+		url_id = getattr(_progress_local, 'url_id', None)
+		if _progress_active:
+			prefix = f'[{url_id}] ' if url_id else ''
+			_progress_q.put_nowait(
+				(
+					url_id,
+					f'{prefix}Progress {pct:5.1f}%  Speed {speed:.0f}B/s  ETA {eta}s',
+				)
+			)
+		elif rounded // _PROGRESS_LOG_STEP != (
+			getattr(_progress_local, 'last_pct', -_PROGRESS_LOG_STEP)
+			// _PROGRESS_LOG_STEP
+		):
+			logging.info(
+				'%sProgress %5.1f%%  Speed %.0fB/s  ETA %ss',
+				f'[{url_id}] ' if url_id else '',
+				pct,
+				speed,
+				eta,
 			)
-			sys.stdout.flush()
+		_progress_local.last_pct = rounded
 	elif d.get('status') in {'finished', 'post_process'}:
+		if _progress_active:
+			_progress_q.put_nowait((getattr(_progress_local, 'url_id', None), None))
 		filename = d.get('filename') or d.get('info_dict', {}).get('_filename')
 		if filename:
 			logging.info('Processed: %s', filename)
@@ -80,6 +456,17 @@ def build_ytdl_opts(
 	playlist_items: Optional[str],
 	write_infojson: bool,
 	clean_infojson: bool,
+	concurrent_fragments: int = 8,
+	http_chunk_size: Optional[int] = None,
+	use_aria2c: bool = False,
+	hwaccel: str = 'none',
+	video_codec: str = 'copy',
+	nvenc_preset: Optional[str] = None,
+	no_subtitles: bool = False,
+	no_thumbnail: bool = False,
+	audio_only: bool = False,
+	force_remux: bool = False,
+	impersonate: Optional[str] = 'auto',
 ):
 	"""Build the options dictionary for ``yt_dlp.YoutubeDL``.
 
@@ -93,6 +480,8 @@ def build_ytdl_opts(
 		file is used.
 	langs : List[str]
 		List of subtitle language codes to request (e.g. ``['zh-Hans','en']``).
+		yt-dlp matches each entry as a regular expression; the live chat
+		track is always excluded.
 	ffmpeg_location : Optional[str]
 		Path to a directory containing ffmpeg executables, passed to
 		yt-dlp if provided.
@@ -109,6 +498,43 @@ def build_ytdl_opts(
 	clean_infojson : bool
 		If ``True`` together with ``write_infojson``, clean redundant fields
 		from the generated info.json.
+	concurrent_fragments : int
+		Number of fragments of a DASH/HLS stream to download in parallel.
+	http_chunk_size : Optional[int]
+		Size in bytes of the ranged chunks requested for plain HTTP
+		downloads, or ``None`` to let yt-dlp request the whole file at once.
+	use_aria2c : bool
+		If ``True``, hand downloads to the external ``aria2c`` downloader
+		using multiple connections per file.
+	hwaccel : str
+		Hardware decoding backend used when re-encoding (``'none'``,
+		``'cuda'``, ``'vaapi'`` or ``'qsv'``).
+	video_codec : str
+		FFmpeg video encoder for the final mp4. ``'copy'`` keeps the
+		downloaded streams as they are; any other value remuxes the result
+		to mp4 if needed and then always re-encodes its video stream.
+	nvenc_preset : Optional[str]
+		NVENC preset (``p1``-``p7``, ``hq``, ``ll``); defaults to ``p4`` for
+		NVENC encoders and is ignored otherwise.
+	no_subtitles : bool
+		If ``True``, do not download or embed subtitles.
+	no_thumbnail : bool
+		If ``True``, do not download, convert or embed thumbnails.
+	audio_only : bool
+		If ``True``, download the best audio stream and extract it to mp3
+		instead of producing an mp4 video; ``video_codec`` is ignored and
+		subtitles are not downloaded.
+	force_remux : bool
+		If ``True`` and ``video_codec`` is ``'copy'``, always remux the
+		result to mp4, even when the selected format is not mp4 compatible.
+		Otherwise streams are only merged into mp4, preferring mp4
+		compatible codecs so the merge is a plain stream copy.
+	impersonate : Optional[str]
+		Browser target for yt-dlp's curl_cffi backend (e.g. ``'chrome'``),
+		which reuses HTTP/2 connections across fragments. ``'auto'`` uses
+		``'chrome'`` when yt-dlp can impersonate it; ``None`` or ``'none'``
+		disables impersonation. Request headers are adjusted by yt-dlp to
+		match the target.
 
 	Returns
 	-------
@@ -116,40 +542,71 @@ def build_ytdl_opts(
 		A dictionary of options suitable to pass into ``yt_dlp.YoutubeDL``.
 
 	"""
-	ydl_opts = {
-		'outtmpl': '%(uploader)s - %(title)s.%(ext)s',
-		'windowsfilenames': True,
-		**({'paths': {'home': output_dir}} if output_dir else {}),
-		'format': 'bv*+ba/b',
-		'merge_output_format': 'mp4',
-		'writesubtitles': True,
-		'embedsubtitles': True,
-		'subtitleslangs': langs,
-		'subtitlesformat': 'srt/best',
-		'writethumbnail': True,
-		'embedthumbnail': True,
-		'retries': 10,
-		'fragment_retries': 10,
-		'continuedl': True,
-		'concurrent_fragment_downloads': 5,
-		'quiet': quiet,
-		'no_warnings': False,
-		'ignoreerrors': False,
-		'progress_hooks': [progress_hook],
-		'postprocessors': [
-			{'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mp4'},
-			{'key': 'FFmpegThumbnailsConvertor', 'format': 'jpg'},
-			{'key': 'EmbedThumbnail', 'already_have_thumbnail': True},
-			{'key': 'FFmpegMetadata'},
-		],
-	}
+	ydl_opts = dict(_BASE_OPTS)
+	if output_dir:
+		ydl_opts['paths'] = {'home': output_dir}
+	# Live chat replays are exposed as a (large) subtitle track; never fetch them.
+	ydl_opts['subtitleslangs'] = langs
+	ydl_opts['compat_opts'] = ['no-live-chat']
+	ydl_opts['concurrent_fragment_downloads'] = concurrent_fragments
+	ydl_opts['quiet'] = quiet
+	ydl_opts['progress_hooks'] = [progress_hook]
+	postprocessors = []
+	if audio_only:
+		ydl_opts['format'] = 'bestaudio/best'
+		postprocessors.append(dict(_EXTRACT_AUDIO_PP))
+	elif video_codec != 'copy':
+		postprocessors.append(dict(_VIDEO_REMUX_PP))
+		postprocessors.append(dict(_VIDEO_REENCODE_PP))
+	else:
+		ydl_opts['format_sort'] = list(_MP4_FORMAT_SORT)
+		if force_remux:
+			postprocessors.append(dict(_VIDEO_REMUX_PP))
+	if no_thumbnail:
+		ydl_opts['writethumbnail'] = False
+		ydl_opts['embedthumbnail'] = False
+	else:
+		postprocessors.extend(dict(pp) for pp in _THUMBNAIL_POSTPROCESSORS)
+	postprocessors.append(dict(_METADATA_PP))
+	ydl_opts['postprocessors'] = postprocessors
+
+	if no_subtitles or audio_only:
+		ydl_opts['writesubtitles'] = False
+		ydl_opts['embedsubtitles'] = False
+
+	if impersonate == 'auto':
+		impersonate = 'chrome' if _impersonate_available('chrome') else None
+	if impersonate and impersonate != 'none':
+		from yt_dlp.networking.impersonate import ImpersonateTarget
+
+		ydl_opts['impersonate'] = ImpersonateTarget.from_str(impersonate)
+
+	if http_chunk_size:
+		ydl_opts['http_chunk_size'] = http_chunk_size
+	if use_aria2c:
+		ydl_opts['external_downloader'] = 'aria2c'
+		ydl_opts['external_downloader_args'] = ['-x', '16', '-s', '16', '-k', '1M']
+
+	if video_codec != 'copy' and not audio_only:
+		input_args = list(_HWACCEL_INPUT_ARGS.get(hwaccel, []))
+		output_args = ['-c:v', video_codec]
+		if video_codec in _NVENC_CODECS:
+			if hwaccel == 'cuda':
+				input_args += ['-hwaccel_output_format', 'cuda']
+			output_args += ['-cq', '23', '-preset', nvenc_preset or 'p4']
+		else:
+			output_args += ['-crf', '23']
+		ydl_opts['postprocessor_args'] = {
+			'copystream+ffmpeg_i': input_args,
+			'copystream+ffmpeg_o': output_args,
+		}
 
 	if cookies_file:
 		ydl_opts['cookiefile'] = cookies_file
 	if ffmpeg_location:
 		ydl_opts['ffmpeg_location'] = ffmpeg_location
 
-	if auto_sub:
+	if auto_sub and not (no_subtitles or audio_only):
 		ydl_opts['writeautomaticsub'] = True
 
 	if no_playlist:
@@ -165,22 +622,221 @@ def build_ytdl_opts(
 	return ydl_opts
 
 
-def download_videos(urls: List[str], args):
-	"""Download a list of video or playlist URLs using yt-dlp.
+class _HostSkipped(Exception):
+	"""Raised for a URL whose host has been cut off by :class:`_ForbiddenHosts`."""
+
+
+class _ForbiddenHosts:
+	"""Count consecutive HTTP 403 failures per host, shared across threads.
+
+	Once a host reaches ``limit`` consecutive 403 responses, its remaining
+	URLs are skipped: a forbidden response usually means missing cookies or
+	a geo block, which will not change for the rest of the batch.
+	"""
+
+	def __init__(self, limit: int):
+		self.limit = limit
+		self._counts: Dict[str, int] = {}
+		self._lock = threading.Lock()
+
+	def is_blocked(self, host: str) -> bool:
+		with self._lock:
+			return self._counts.get(host, 0) >= self.limit
+
+	def record(self, host: str, status: Optional[int]):
+		"""Record the outcome of a download; ``status`` is ``None`` on success."""
+		with self._lock:
+			if status != 403:
+				self._counts.pop(host, None)
+				return
+			count = self._counts.get(host, 0) + 1
+			self._counts[host] = count
+		if count == self.limit:
+			logging.warning(
+				'Skipping remaining URLs from %s after %d consecutive HTTP 403 errors',
+				host,
+				count,
+			)
+
+
+def _http_status(exc: BaseException) -> Optional[int]:
+	"""Return the HTTP status code behind a yt-dlp error, if any."""
+	seen = set()
+	while exc is not None and id(exc) not in seen:
+		seen.add(id(exc))
+		status = getattr(exc, 'status', None)
+		if isinstance(status, int):
+			return status
+		if isinstance(exc, _yt_dlp().utils.DownloadError) and exc.exc_info:
+			exc = exc.exc_info[1]
+		else:
+			exc = getattr(exc, 'cause', None) or exc.__cause__
+	return None
+
+
+def _error_status(exc: BaseException) -> Optional[int]:
+	"""Like :func:`_http_status`, falling back to parsing the error message."""
+	status = _http_status(exc)
+	if status is None:
+		match = _HTTP_STATUS_RE.search(str(exc))
+		if match:
+			status = int(match.group(1))
+	return status
+
+
+def _default_fragment_concurrency() -> int:
+	"""Return the fragment concurrency for hosts missing from the table."""
+	if hasattr(os, 'sched_getaffinity'):
+		cpus = len(os.sched_getaffinity(0))
+	else:
+		cpus = os.cpu_count() or 1
+	return min(16, cpus * 2)
+
+
+def _fragment_concurrency(url: str) -> int:
+	"""Pick ``concurrent_fragment_downloads`` for ``url`` by its host name."""
+	hostname = urlsplit(url).hostname or ''
+	for domain, count in _FRAG_CONCURRENCY.items():
+		if hostname == domain or hostname.endswith(f'.{domain}'):
+			return count
+	return _default_fragment_concurrency()
+
+
+def _download_url(
+	ydl: 'yt_dlp.YoutubeDL',
+	url: str,
+	forbidden: _ForbiddenHosts,
+	auto_fragments: bool = False,
+) -> str:
+	"""Download ``url`` with ``ydl`` and return the resulting file path.
+
+	With ``auto_fragments``, the fragment concurrency of ``ydl`` is set for
+	``url``'s host (see :func:`_fragment_concurrency`) before downloading;
+	yt-dlp reads it from ``ydl.params`` for every download.
+
+	HTTP 429 responses are retried up to ``_RATE_LIMIT_RETRIES`` times with
+	exponential backoff. Failures are reported to ``forbidden``, and URLs
+	whose host it has blocked raise :class:`_HostSkipped` without a request.
+
+	yt-dlp records the final path of each download in the returned info
+	dict, so the output template is only expanded again via
+	``prepare_filename`` when that path is missing (e.g. for playlists).
+	"""
+	host = urlsplit(url).netloc
+	if forbidden.is_blocked(host):
+		raise _HostSkipped(host)
+	if auto_fragments:
+		ydl.params['concurrent_fragment_downloads'] = _fragment_concurrency(url)
+
+	utils = _yt_dlp().utils
+	attempt = 0
+	while True:
+		try:
+			info = ydl.extract_info(url, download=True)
+			break
+		except (utils.DownloadError, utils.ExtractorError) as e:
+			status = _error_status(e)
+			if status == 429 and attempt < _RATE_LIMIT_RETRIES:
+				attempt += 1
+				delay = min(2**attempt, _RATE_LIMIT_MAX_DELAY)
+				logging.warning(
+					'HTTP 429 for %s; retrying in %ds (%d/%d)',
+					url,
+					delay,
+					attempt,
+					_RATE_LIMIT_RETRIES,
+				)
+				time.sleep(delay)
+				continue
+			forbidden.record(host, status)
+			raise
+	forbidden.record(host, None)
+
+	requested = info.get('requested_downloads') or [{}]
+	filepath = requested[0].get('filepath') or info.get('_filename')
+	return filepath or ydl.prepare_filename(info)
+
+
+class _ThreadYoutubeDL:
+	"""Hand out one ``YoutubeDL`` per worker thread, created on first use.
+
+	``YoutubeDL`` instances are not safe for concurrent ``extract_info``
+	calls, but each one is expensive to set up, so every worker thread keeps
+	a private instance for all the URLs it handles. :meth:`close` closes
+	them once the pool has finished.
+	"""
+
+	def __init__(self, ydl_opts: dict):
+		self._opts = ydl_opts
+		self._local = threading.local()
+		self._instances: List['yt_dlp.YoutubeDL'] = []
+		self._lock = threading.Lock()
+
+	def get(self) -> 'yt_dlp.YoutubeDL':
+		ydl = getattr(self._local, 'ydl', None)
+		if ydl is None:
+			# yt-dlp keeps the dict it is given as ``params``; copy it so
+			# the per-URL fragment setting of _download_url stays per thread.
+			ydl = self._local.ydl = _yt_dlp().YoutubeDL(dict(self._opts))
+			with self._lock:
+				self._instances.append(ydl)
+		return ydl
+
+	def close(self):
+		with self._lock:
+			instances, self._instances = self._instances, []
+		for ydl in instances:
+			ydl.close()
+
+
+def _download_worker(
+	url: str,
+	ydls: _ThreadYoutubeDL,
+	url_id: str,
+	forbidden: _ForbiddenHosts,
+	auto_fragments: bool,
+) -> str:
+	"""Download ``url`` in a worker thread with that thread's ``YoutubeDL``."""
+	_progress_local.url_id = url_id
+	try:
+		return _download_url(ydls.get(), url, forbidden, auto_fragments)
+	finally:
+		_progress_local.url_id = None
+		# yt-dlp sends no progress event for a failed download, so drop the
+		# URL's status line here rather than only on ``finished``.
+		if _progress_active:
+			_progress_q.put_nowait((url_id, None))
+
+
+def download_videos(urls: Iterable[str], args):
+	"""Download video or playlist URLs using yt-dlp.
 
 	This function constructs yt-dlp options from the parsed CLI ``args`` and
-	attempts to download each URL in ``urls``. Failures are collected and
-	reported via logging.
+	attempts to download each URL in ``urls``. ``urls`` is consumed lazily,
+	so downloads start while later URLs are still being read. With
+	``args.jobs`` greater than 1, URLs are downloaded concurrently in a
+	thread pool, each worker thread reusing its own ``YoutubeDL`` instance;
+	otherwise a single instance serves every URL. In both cases yt-dlp's
+	start-up cost is paid once per thread rather than once per URL. At most
+	``2 * args.jobs`` URLs are queued at a time. Rate-limited (HTTP 429)
+	URLs are retried with backoff, and once a host has answered several
+	URLs in a row with HTTP 403 its remaining URLs are skipped. Failures
+	and skipped URLs are collected and reported via logging. On a terminal,
+	progress is drawn by a single writer thread as one status line per
+	active download, and yt-dlp's own messages are routed through logging.
 
 	Parameters
 	----------
-	urls : List[str]
-		List of video or playlist URLs to download.
+	urls : Iterable[str]
+		Video or playlist URLs to download.
 	args : argparse.Namespace
 		Parsed arguments (as returned by :func:`parse_args`). Expected attributes
 		include ``output_dir``, ``cookies``, ``langs``, ``ffmpeg``, ``quiet``,
-		``auto_sub``, ``no_playlist``, ``playlist_items``, ``write_infojson`` and
-		``clean_infojson``.
+		``auto_sub``, ``no_playlist``, ``playlist_items``, ``write_infojson``,
+		``clean_infojson``, ``concurrent_fragments`` (``None`` picks a value
+		per URL host), ``http_chunk_size``, ``aria2c``, ``hwaccel``,
+		``video_codec``, ``nvenc_preset``, ``no_subtitles``, ``no_thumbnail``,
+		``audio_only``, ``force_remux``, ``impersonate`` and ``jobs``.
 
 	Returns
 	-------
@@ -193,9 +849,7 @@ def download_videos(urls: List[str], args):
 	"""
 	ydl_opts = build_ytdl_opts(
 		output_dir=args.output_dir,
-		cookies_file=args.cookies
-		if (args.cookies and os.path.isfile(args.cookies))
-		else None,
+		cookies_file=args.cookies,
 		langs=args.langs,
 		ffmpeg_location=args.ffmpeg,
 		quiet=args.quiet,
@@ -204,38 +858,97 @@ def download_videos(urls: List[str], args):
 		playlist_items=args.playlist_items,
 		write_infojson=args.write_infojson,
 		clean_infojson=args.clean_infojson,
+		concurrent_fragments=args.concurrent_fragments
+		or _default_fragment_concurrency(),
+		http_chunk_size=args.http_chunk_size,
+		use_aria2c=args.aria2c,
+		hwaccel=args.hwaccel,
+		video_codec=args.video_codec,
+		nvenc_preset=args.nvenc_preset,
+		no_subtitles=args.no_subtitles,
+		no_thumbnail=args.no_thumbnail,
+		audio_only=args.audio_only,
+		force_remux=args.force_remux,
+		impersonate=args.impersonate,
 	)
 
-	logging.debug(
-		'ydl_opts: %s',
-		{
-			k: ydl_opts[k]
-			for k in (
-				'format',
-				'merge_output_format',
-				'writesubtitles',
-				'embedsubtitles',
-				'subtitleslangs',
-				'writethumbnail',
-				'embedthumbnail',
-				'retries',
-				'continuedl',
-				'concurrent_fragment_downloads',
-			)
-			if k in ydl_opts
-		},
-	)
+	if logging.getLogger().isEnabledFor(logging.DEBUG):
+		logging.debug(
+			'ydl_opts: %s',
+			{k: ydl_opts[k] for k in _DEBUG_OPT_KEYS if k in ydl_opts},
+		)
 
 	failed: List[str] = []
-	with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-		for url in urls:
+	forbidden = _ForbiddenHosts(_FORBIDDEN_LIMIT)
+	auto_fragments = args.concurrent_fragments is None
+	with _progress_display() as redrawing:
+		if redrawing:
+			# yt-dlp's own messages would scroll the status block away; route
+			# them through logging and leave progress to progress_hook.
+			ydl_opts['logger'] = _YtdlpLogger(args.quiet)
+			ydl_opts['noprogress'] = True
+		if args.jobs > 1:
+			failed_lock = threading.Lock()
+			slots = threading.BoundedSemaphore(args.jobs * 2)
+
+			def report(future: Future, url: str):
+				if future.cancelled():
+					slots.release()
+					return
+				try:
+					filepath = future.result()
+					logging.info('Downloaded: %s', filepath)
+				except _HostSkipped:
+					logging.info('Skipped: %s', url)
+					with failed_lock:
+						failed.append(url)
+				except Exception as e:
+					logging.exception('Download failed: %s | URL: %s', e, url)
+					with failed_lock:
+						failed.append(url)
+				finally:
+					slots.release()
+
+			ydls = _ThreadYoutubeDL(ydl_opts)
 			try:
-				info = ydl.extract_info(url, download=True)
-				filepath = ydl.prepare_filename(info)
-				logging.info('Downloaded: %s', filepath)
-			except Exception as e:
-				logging.exception('Download failed: %s | URL: %s', e, url)
-				failed.append(url)
+				executor = ThreadPoolExecutor(max_workers=args.jobs)
+				try:
+					for i, url in enumerate(urls, 1):
+						slots.acquire()
+						future = executor.submit(
+							_download_worker,
+							url,
+							ydls,
+							f'#{i}',
+							forbidden,
+							auto_fragments,
+						)
+						future.add_done_callback(lambda f, url=url: report(f, url))
+					executor.shutdown(wait=True)
+				except BaseException:
+					# E.g. Ctrl-C: drop queued URLs instead of downloading them all
+					# before exiting. In-flight downloads still use their
+					# YoutubeDL, so wait for them before ydls.close() below.
+					executor.shutdown(wait=True, cancel_futures=True)
+					raise
+			finally:
+				ydls.close()
+		else:
+			# One instance for the whole batch: yt-dlp caches extractor instances
+			# (and with them YouTube's player JS) per YoutubeDL, so this gets the
+			# same reuse as ``ydl.download(urls)`` while keeping URLs streamed
+			# and failures tracked per URL.
+			with _yt_dlp().YoutubeDL(ydl_opts) as ydl:
+				for url in urls:
+					try:
+						filepath = _download_url(ydl, url, forbidden, auto_fragments)
+						logging.info('Downloaded: %s', filepath)
+					except _HostSkipped:
+						logging.info('Skipped: %s', url)
+						failed.append(url)
+					except Exception as e:
+						logging.exception('Download failed: %s | URL: %s', e, url)
+						failed.append(url)
 
 	if failed:
 		logging.warning(
@@ -245,6 +958,44 @@ def download_videos(urls: List[str], args):
 		)
 
 
+def iter_urls(urls: List[str], urls_file: Optional[str] = None) -> Iterator[str]:
+	"""Yield URLs from the command line and an optional URL list file.
+
+	Parameters
+	----------
+	urls : List[str]
+		URLs given on the command line. A ``-`` entry is replaced by the
+		URLs read from standard input.
+	urls_file : Optional[str]
+		Path to a file with one URL per line, or ``-`` for standard input.
+
+	Yields
+	------
+	str
+		URLs in order. Lines from stdin or ``urls_file`` are read lazily;
+		blank lines and lines starting with ``#`` are skipped.
+
+	"""
+
+	def read_lines(lines: Iterable[str]) -> Iterator[str]:
+		for line in lines:
+			line = line.strip()
+			if line and not line.startswith('#'):
+				yield line
+
+	for url in urls:
+		if url == '-':
+			yield from read_lines(sys.stdin)
+		else:
+			yield url
+
+	if urls_file == '-':
+		yield from read_lines(sys.stdin)
+	elif urls_file:
+		with open(urls_file, encoding='utf-8') as f:
+			yield from read_lines(f)
+
+
 def parse_args(argv: List[str]):
 	"""Parse command-line arguments for the downloader.
 
@@ -258,12 +1009,28 @@ def parse_args(argv: List[str]):
 	argparse.Namespace
 		Parsed arguments with normalized fields. Notable post-processing:
 		``langs`` is converted from a comma-separated string to ``List[str]``.
+		With ``stdin_loop``, ``-`` is appended to ``urls`` so standard input
+		is read after any URLs given on the command line.
 		If the provided cookies file path does not exist, ``cookies`` will be
-		set to ``None`` and a warning will be emitted.
+		set to ``None`` and a warning will be emitted; otherwise it can be used
+		without further checks. ``output_dir``, when given, is resolved to an
+		absolute path and created if missing.
 
 	"""
 	parser = argparse.ArgumentParser(description='YouTube downloader (yt-dlp wrapper)')
-	parser.add_argument('urls', nargs='+', help='One or more video/playlist URLs')
+	parser.add_argument(
+		'urls',
+		nargs='*',
+		help='Video/playlist URLs; use "-" to read URLs from standard input',
+	)
+	parser.add_argument(
+		'-a',
+		'--urls-file',
+		default=None,
+		metavar='PATH',
+		help='File with one URL per line ("-" for standard input); '
+		'blank lines and lines starting with "#" are ignored',
+	)
 	parser.add_argument(
 		'-o',
 		'--output-dir',
@@ -314,8 +1081,133 @@ def parse_args(argv: List[str]):
 		action='store_true',
 		help='Clean redundant fields in info.json (with --write-infojson)',
 	)
+	parser.add_argument(
+		'-j',
+		'--jobs',
+		type=int,
+		default=1,
+		help='Number of URLs to download concurrently (default: 1)',
+	)
+	parser.add_argument(
+		'--concurrent-fragments',
+		type=int,
+		default=None,
+		metavar='N',
+		help='Number of DASH/HLS fragments to download in parallel (default: '
+		'chosen per host, e.g. 4 for YouTube and 16 for archive.org, otherwise '
+		'twice the CPU count up to 16). Higher values speed up sites that '
+		'throttle per connection but add server load and may trigger rate '
+		'limiting',
+	)
+	parser.add_argument(
+		'--http-chunk-size',
+		type=int,
+		default=None,
+		metavar='BYTES',
+		help='Download plain HTTP files in ranged chunks of this many bytes; '
+		'helps with servers that throttle long-lived connections',
+	)
+	parser.add_argument(
+		'--aria2c',
+		action='store_true',
+		help='Use aria2c as external downloader with 16 connections per file. '
+		'Much faster on throttled hosts, but more likely to be rate limited',
+	)
+	parser.add_argument(
+		'--impersonate',
+		default='auto',
+		metavar='TARGET',
+		help='Browser to impersonate via curl_cffi (e.g. chrome, safari, '
+		'chrome-124), reusing one HTTP/2 connection for all fragments; '
+		'"auto" uses chrome when a supported curl_cffi is installed '
+		'(default), "none" disables it',
+	)
+	parser.add_argument(
+		'--hwaccel',
+		default='none',
+		choices=['none', 'cuda', 'vaapi', 'qsv'],
+		help='Hardware decoding backend used when re-encoding (requires a '
+		're-encoding --video-codec; default: none)',
+	)
+	parser.add_argument(
+		'--video-codec',
+		default='copy',
+		choices=['copy', 'libx264', *_NVENC_CODECS],
+		help='Video encoder for the mp4 output; "copy" keeps the downloaded '
+		'streams (default), NVENC encoders re-encode on an NVIDIA GPU',
+	)
+	parser.add_argument(
+		'--force-remux',
+		action='store_true',
+		help='Always remux the output to mp4, even when the selected format '
+		'is not mp4 (with --video-codec copy)',
+	)
+	parser.add_argument(
+		'--nvenc-preset',
+		default=None,
+		choices=_NVENC_PRESETS,
+		help='NVENC encoder preset (requires --hwaccel cuda and an NVENC '
+		'--video-codec; default: p4)',
+	)
+	parser.add_argument(
+		'--no-subtitles',
+		action='store_true',
+		help='Do not download or embed subtitles',
+	)
+	parser.add_argument(
+		'--no-thumbnail',
+		action='store_true',
+		help='Do not download, convert or embed thumbnails',
+	)
+	parser.add_argument(
+		'--audio-only',
+		action='store_true',
+		help='Download the best audio stream and extract it to mp3 '
+		'(no subtitles are written)',
+	)
+	parser.add_argument(
+		'--stdin-loop',
+		'--server',
+		action='store_true',
+		help='Keep running and download each URL read from standard input '
+		'until end of input, reusing one yt-dlp instance per job',
+	)
 	args = parser.parse_args(argv)
 
+	if args.stdin_loop and '-' not in args.urls:
+		args.urls.append('-')
+	if not args.urls and not args.urls_file:
+		parser.error('no URLs given; pass URLs, "-" or --urls-file')
+	if args.urls_file and args.urls_file != '-' and not os.path.isfile(args.urls_file):
+		parser.error(f'URL list file does not exist: {args.urls_file}')
+	if args.audio_only and args.video_codec != 'copy':
+		parser.error('--video-codec cannot be combined with --audio-only')
+	if args.hwaccel != 'none' and (args.audio_only or args.video_codec == 'copy'):
+		parser.error('--hwaccel requires a re-encoding --video-codec')
+	if args.force_remux and (args.audio_only or args.video_codec != 'copy'):
+		parser.error('--force-remux only applies with --video-codec copy')
+	if args.nvenc_preset:
+		if args.hwaccel != 'cuda':
+			parser.error('--nvenc-preset requires --hwaccel cuda')
+		if args.video_codec not in _NVENC_CODECS:
+			parser.error('--nvenc-preset requires an NVENC --video-codec')
+	if args.jobs < 1:
+		parser.error('--jobs must be at least 1')
+	if args.concurrent_fragments is not None and args.concurrent_fragments < 1:
+		parser.error('--concurrent-fragments must be at least 1')
+	if args.http_chunk_size is not None and args.http_chunk_size < 1:
+		parser.error('--http-chunk-size must be a positive number of bytes')
+	if args.impersonate not in ('auto', 'none'):
+		try:
+			available = _impersonate_available(args.impersonate)
+		except ValueError as e:
+			parser.error(f'invalid --impersonate target: {e}')
+		if not available:
+			parser.error(
+				f'impersonate target "{args.impersonate}" is not available; '
+				'install a curl_cffi version supported by yt-dlp'
+			)
+
 	args.langs = [s.strip() for s in args.langs.split(',') if s.strip()]
 
 	if args.cookies and not os.path.isfile(args.cookies):
@@ -325,6 +1217,13 @@ def parse_args(argv: List[str]):
 		)
 		args.cookies = None
 
+	if args.output_dir:
+		args.output_dir = os.fspath(Path(args.output_dir).resolve())
+		try:
+			os.makedirs(args.output_dir, exist_ok=True)
+		except OSError as e:
+			parser.error(f'cannot create output directory {args.output_dir}: {e}')
+
 	return args
 
 
@@ -343,7 +1242,8 @@ def main(argv: Optional[List[str]] = None):
 
 	Side effects
 	------------
-	Configures basic logging and invokes :func:`download_videos`.
+	Configures basic logging and invokes :func:`download_videos` with the
+	URLs produced by :func:`iter_urls`.
 
 	"""
 	argv = argv if argv is not None else sys.argv[1:]
@@ -353,7 +1253,7 @@ def main(argv: Optional[List[str]] = None):
 		level=getattr(logging, args.log_level), format='[%(levelname)s] %(message)s'
 	)
 
-	download_videos(args.urls, args)
+	download_videos(iter_urls(args.urls, args.urls_file), args)
 
 
 if __name__ == '__main__':